@@ -11,21 +11,28 @@ This module demonstrates several key Python concepts for beginners:
 2. SPECIAL METHODS (Magic Methods):
    - __init__: Constructor that runs when creating an instance
    - __len__: Enables len(deck) to work on your custom class
-   - __getitem__: Enables indexing (deck[0]) and slicing (deck[1:5])
+   - __getitem__: Enables indexing (deck[0]) and slicing (deck[1:5]);
+     slices are tuples, so call list() on one if you need a list
+   - __iter__ / __reversed__: Enable for loops and reversed(deck)
+   - __contains__: Enables the in operator (card in deck)
    - These make your class work with Python's built-in functions
 
-3. LIST COMPREHENSIONS:
+3. COMPREHENSIONS AND GENERATOR EXPRESSIONS:
    - Concise way to create lists: [expression for item in iterable]
    - Nested comprehensions: [Card(r,s) for s in suits for r in ranks]
    - Equivalent to nested for loops but more Pythonic
+   - itertools.product(suits, ranks) flattens the nested loop into one
 
 4. CLASS vs INSTANCE ATTRIBUTES:
-   - Class attributes (ranks, suits): shared by all instances
-   - Instance attributes (self._cards): unique to each instance
+   - Class attributes (ranks, suits, _CARDS): shared by all instances
+   - Instance attributes (self._cards): set per instance, but here it just
+     points at the shared _CARDS tuple, so every deck shares the same cards
 
 5. PYTHON DATA MODEL:
    - By implementing __len__ and __getitem__, the deck works with:
      * len(), max(), min(), in operator, for loops, slicing, random.choice()
+   - __iter__, __reversed__ and __contains__ aren't required for that, but
+     defining them lets loops and the in operator skip the __getitem__ fallback
    - This is the "Python way" - make objects behave like built-in types
 
 KEY LEARNING POINTS:
@@ -35,6 +42,7 @@ KEY LEARNING POINTS:
 """
 
 import collections
+import itertools
 
 # Create a Card namedtuple with rank and suit fields
 # namedtuple creates a lightweight class with named fields
@@ -46,15 +54,37 @@ class FrenchDeck:
     # Class attributes for all cards in a standard deck
     # ranks: 2-10 as strings, plus face cards J, Q, K, A
     ranks = [str(n) for n in range(2, 11)] + list('JQKA')
+    # rank values for ranking: a dict lookup is O(1), unlike ranks.index()
+    # which scans the list on every call (2=0, 3=1, ..., A=12)
+    _rank_values = {rank: value for value, rank in enumerate(ranks)}
     # suits: standard four suits as a list
     suits = 'spades diamonds clubs hearts'.split()
-    # suit values for ranking (spades highest, clubs lowest)
-    suit_values = dict(spades=3, hearts=2, diamonds=1, clubs=0)
+    # suit order for ranking, lowest to highest (clubs lowest, spades highest)
+    # This is a separate list because it's a different order from suits:
+    # suits is the order the deck is laid out in, this is how suits rank
+    _suit_order = 'clubs diamonds hearts spades'.split()
+    # suit values for ranking, numbered from that order (clubs=0, ..., spades=3)
+    suit_values = {suit: value for value, suit in enumerate(_suit_order)}
+    # All 52 cards, built once when the class is defined: for each suit,
+    # create cards for all ranks. A tuple because the deck never changes.
+    # (A comprehension body can't see class attributes, so product() feeds
+    # it the (suit, rank) pairs instead of a nested 'for ... in ranks'.)
+    _CARDS = tuple(Card(rank, suit) for suit, rank in itertools.product(suits, ranks))
+    # The same cards as a set, so membership is one hash lookup, not a scan
+    _CARD_SET = frozenset(_CARDS)
+    # The same cards keyed by (rank, suit), so deck.card() can hand back the
+    # existing Card object instead of creating a new one
+    _BY_KEY = {(card.rank, card.suit): card for card in _CARDS}
+    # Every card packed into one byte: its spades_high value (rank value * 4
+    # + suit value), in the same order as _CARDS. All 52 scores fit in 52 bytes.
+    _PACKED = bytes(rank_value * 4 + suit_value
+                    for suit_value, rank_value in itertools.product(map(suit_values.get, suits),
+                                                                    range(len(ranks))))
 
     def __init__(self):
-        # Initialize the deck by creating all 52 cards
-        # Nested list comprehension: for each suit, create cards for all ranks
-        self._cards = [Card(rank, suit) for suit in self.suits for rank in self.ranks]
+        # Every deck shares the same immutable tuple of cards, so creating
+        # a deck is a single assignment instead of building 52 new Cards
+        self._cards = FrenchDeck._CARDS
 
     def __len__(self):
         # Return the number of cards in the deck (enables len(deck))
@@ -62,22 +92,66 @@ class FrenchDeck:
 
     def __getitem__(self, position):
         # Enable indexing and slicing (deck[0], deck[1:5], etc.)
+        # _cards is a tuple, so a slice comes back as a tuple of Cards
+        # (tuples are sized exactly, with no spare room like a list keeps)
         return self._cards[position]
+
+    def __iter__(self):
+        # Enable for loops (for card in deck) using the tuple's own iterator
+        # Without this, Python falls back to calling __getitem__ with 0, 1, 2, ...
+        return iter(self._cards)
+
+    def __reversed__(self):
+        # Enable reversed(deck) without going through __getitem__ either
+        return reversed(self._cards)
+
+    def __contains__(self, card):
+        # Enable the in operator (card in deck) with a set lookup
+        # Without this, Python falls back to comparing card against each item
+        try:
+            return card in self._CARD_SET
+        except TypeError:
+            # Unhashable things like [1] can't be in a set, so they aren't in the deck
+            return False
+
+    def card(self, rank, suit):
+        # Return the deck's own Card for this rank and suit (no new object)
+        # Raises KeyError for a rank/suit combination that isn't in the deck
+        return self._BY_KEY[(rank, suit)]
     
     def __repr__(self):
         # Return a string representation that could recreate the object
         # Following Python convention: repr should be unambiguous and ideally executable
         return f'FrenchDeck()'
     
-    def spades_high(self, card):
+    def spades_high(self, card, *, _rank_values=_rank_values):
         # Calculate card value with spades being highest suit
-        # rank_value: position of rank in ranks list (2=0, 3=1, ..., A=12)
-        rank_value = FrenchDeck.ranks.index(card.rank)
-        # multiply by 4 (number of suits) and add suit value for unique ranking
-        return rank_value * len(self.suit_values) + self.suit_values[card.suit]
-
-
-if __name__ == "__main__":
+        # multiply rank value by 4 (number of suits) and add suit value for unique ranking
+        # The private rank table is bound as a keyword-only default when the class
+        # is defined, so it is a fast local variable instead of an attribute lookup.
+        # suit_values is still read from self so a subclass can rank suits differently.
+        return _rank_values[card.rank] * 4 + self.suit_values[card.suit]
+
+    def rank_all(self):
+        # Return a list of the spades_high value of every card, in deck order
+        # The values were packed into bytes when the class was defined, so
+        # this is just a copy of them as ints, with no scoring done per card
+        return list(self._PACKED)
+
+    def highest(self):
+        # Return the card with the highest spades_high value (the ace of spades)
+        # max() and .index() both run over the precomputed scores in C
+        scores = self.rank_all()
+        return self._cards[scores.index(max(scores))]
+
+    def lowest(self):
+        # Return the card with the lowest spades_high value (the 2 of clubs)
+        scores = self.rank_all()
+        return self._cards[scores.index(min(scores))]
+
+
+def _demo(full=False):
+    # Walk through the deck examples; full=True also prints every card twice
     from random import choice
     
     print("=== French Deck Examples ===\n")
@@ -110,8 +184,10 @@ if __name__ == "__main__":
     
     # Checking if the deck contains specific cards
     print("--- Checking card membership ---")
-    ace_of_spades = Card('A', 'spades')
-    king_of_hearts = Card('K', 'hearts')
+    # deck.card() returns the deck's existing Card objects
+    ace_of_spades = deck.card('A', 'spades')
+    king_of_hearts = deck.card('K', 'hearts')
+    # A card that isn't in the deck has to be created ourselves
     fake_card = Card('15', 'rockets')
     
     print(f"Deck contains {ace_of_spades}: {ace_of_spades in deck}")
@@ -122,8 +198,10 @@ if __name__ == "__main__":
     print("--- Other built-in examples ---")
     print(f"Total cards: {len(deck)}")
     print(f"First 3 cards: {list(deck[:3])}")
-    print(f"All suits in deck: {set(card.suit for card in deck)}")
-    print(f"All ranks in deck: {set(card.rank for card in deck)}")
+    # The deck always holds every suit and rank, so use the class attributes
+    # instead of looping over all 52 cards to rediscover them
+    print(f"All suits in deck: {set(deck.suits)}")
+    print(f"All ranks in deck: {set(deck.ranks)}")
     
     # Reverse iteration
     print(f"Last 3 cards (reversed): {list(reversed(deck[-3:]))}")
@@ -138,15 +216,31 @@ if __name__ == "__main__":
     for card in sample_cards:
         print(f"{card}: {deck.spades_high(card)}")
     
-    highest_card = max(deck, key=deck.spades_high)
-    lowest_card = min(deck, key=deck.spades_high)
+    # The scores are precomputed, so no spades_high calls are needed here
+    highest_card = deck.highest()
+    lowest_card = deck.lowest()
     print(f"Highest value card: {highest_card} (value: {deck.spades_high(highest_card)})")
     print(f"Lowest value card: {lowest_card} (value: {deck.spades_high(lowest_card)})")
     
+    # Printing all 52 cards (twice) is slow and long, so only on request
+    if not full:
+        print("\n(Run with --full to print every card forwards and backwards)")
+        return
+
     # For loop
     for card in deck:
         print(card)
 
     # For loop can also be reversed
     for card in reversed(deck):
-        print(card)
\ No newline at end of file
+        print(card)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="FrenchDeck examples")
+    parser.add_argument('--full', action='store_true',
+                        help="also print every card in the deck, forwards and backwards")
+    args = parser.parse_args()
+    _demo(full=args.full)
@@ -16,6 +16,10 @@ Key Learning Points:
 - Works with any iterable (lists, tuples, strings, etc.)
 """
 
+import csv
+import posixpath
+from itertools import compress
+
 # Sample data: metro areas with nested coordinate tuples
 metro_areas = [
     ('Tokyo', 'JP', 36.933, (35.689722, 139.691667)),
@@ -25,6 +29,11 @@ metro_areas = [
     ('São Paulo', 'BR', 19.649, (-23.547778, -46.635833)),
 ]
 
+# The same data stored column by column (one tuple per field) instead of
+# row by row. zip(*rows) transposes the rows, and unpacking names the columns.
+metro_names, metro_countries, metro_populations, metro_coords = zip(*metro_areas)
+metro_lats, metro_lons = zip(*metro_coords)
+
 def basic_unpacking_examples():
     """Demonstrate basic tuple unpacking techniques"""
     print("=== BASIC UNPACKING EXAMPLES ===\n")
@@ -54,13 +63,18 @@ def nested_unpacking_examples():
     print(f"Age: {age}, Job: {job}")
     print(f"Location: {city}, {state}\n")
     
-    # Original metro areas example
+    # Original metro areas example: unpack every row, then test it
     print("Metro areas in Western Hemisphere (longitude <= 0):")
     print(f'{"":15} | {"latitude":>9} | {"longitude":>9}')
     for name, _, _, (lat, lon) in metro_areas:
         if lon <= 0:
             print(f'{name:15} | {lat:9.4f} | {lon:9.4f}')
     print()
+    
+    # Same filter using the columns: test the longitude column alone, and
+    # compress() keeps the names whose test was True - no rows to unpack
+    western_names = list(compress(metro_names, (lon <= 0 for lon in metro_lons)))
+    print(f"Same filter from the columns: {western_names}\n")
 
 def ignoring_values_examples():
     """Show how to ignore unwanted values with _"""
@@ -113,9 +127,10 @@ def practical_examples():
         'Bob,Johnson,Manager,85000'
     ]
     
+    # csv.reader splits every line for us (in C), and each row it yields
+    # is a list we can unpack straight into names
     print("Employee salary report:")
-    for line in csv_data:
-        first, last, position, salary = line.split(',')
+    for first, last, position, salary in csv.reader(csv_data):
         print(f"{first} {last} ({position}): ${int(salary):,}")
     print()
     
@@ -126,12 +141,16 @@ def practical_examples():
         '/etc/config/settings.conf'
     ]
     
+    # posixpath.split and posixpath.splitext each return a 2-tuple, so they
+    # unpack neatly without building a list of every path part.
+    # splitext keeps the dot in the extension and returns '' when there is none.
+    # join(directory, '') adds the trailing slash unless there already is one ('/')
     print("File analysis:")
     for path in file_paths:
-        *directories, filename = path.split('/')
-        name, extension = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-        print(f"Path: {'/'.join(directories)}/")
-        print(f"File: {name}.{extension}")
+        directory, filename = posixpath.split(path)
+        name, extension = posixpath.splitext(filename)
+        print(f"Path: {posixpath.join(directory, '')}")
+        print(f"File: {name}{extension}")
         print()
 
 def enumeration_unpacking():
@@ -145,10 +164,11 @@ def enumeration_unpacking():
         print(f"{index}. {city}")
     print()
     
-    # Enumerate with nested data
+    # Enumerate with rows rebuilt from the columns: zip() yields each row as
+    # one flat tuple, so there's no nested coords tuple left to unpack
     print("Metro areas with rankings:")
-    for rank, (name, country, population, coords) in enumerate(metro_areas, 1):
-        lat, lon = coords
+    rows = zip(metro_names, metro_countries, metro_populations, metro_lats, metro_lons)
+    for rank, (name, country, population, lat, lon) in enumerate(rows, 1):
         print(f"{rank}. {name}, {country} - Pop: {population}M - Coords: ({lat:.2f}, {lon:.2f})")
     print()
 